@@ -9,11 +9,21 @@ digging through the plotting code.
 Date: October 28, 2025
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import hashlib
+import inspect
+from pathlib import Path
+
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Batch PDF output only - skip GUI backend discovery
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Rectangle, Patch
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
+from matplotlib.backends.backend_pdf import PdfPages
 import numpy as np
 
 # ============================================================================
@@ -23,6 +33,7 @@ import numpy as np
 # File paths
 INPUT_FILE = '/home/david/projects/asp_curriculum/AS Survey Graphs.xlsx'
 OUTPUT_DIR = '/home/david/projects/asp_curriculum/'
+CACHE_DIR = Path(INPUT_FILE).with_suffix('.parquet.cache')  # Parsed-sheet cache
 
 # Color scheme (modify these to change colors throughout)
 COLOR_POSITIVE = '#2C7BB6'      # Blue - for positive/desired outcomes
@@ -44,54 +55,199 @@ ANNOTATION_SIZE = 9
 # Figure DPI
 DPI = 300  # Publication quality (300-600 recommended)
 
+# Rasterize decorative shapes (boxes, bars, dumbbells) at DPI. Off by default:
+# for these simple shapes it makes the PDFs larger and turns them into bitmaps
+# that cannot be edited in Illustrator. Text always stays vector/editable.
+RASTERIZE_DECORATIONS = False
+
+# Parallel rendering (one worker process per figure)
+MAX_WORKERS = 3
+
+# Output mode: False = one PDF per figure (default), True = all figures as pages
+# of a single PDF (shares embedded fonts; rendered sequentially)
+COMBINED_PDF = False
+COMBINED_PDF_NAME = 'Figures_All.pdf'
+
+# Skip re-rendering a figure when its data and code are unchanged since the last
+# run (tracked with a .sha256 file next to each PDF). Set False to force a rebuild.
+SKIP_UNCHANGED = True
+
 # Sample size
 TOTAL_PROGRAMS = 27
 
+# ============================================================================
+# SURVEY DATA (from Excel)
+# ============================================================================
+
+# Response ranges on the 'Interest in AS' sheet and the midpoint used for each
+_RANGE_LABELS = ['0-25%', '26-50%', '51-75%', '76-100%']
+_MIDPOINTS = np.array([12.5, 37.5, 62.5, 87.5])
+
+# Satisfaction counts per competency
+_SAT_CATEGORIES = [
+    'General education/\nbackground knowledge',
+    'Ability to use AS in\nclinical practice',
+    'Ability to assume a\nleadership role in AS'
+]
+_SAT_VERY_SATISFIED = np.array([9, 10, 3])
+_SAT_SOMEWHAT_SATISFIED = np.array([14, 15, 12])
+_SAT_NEITHER = np.array([1, 0, 8])
+_SAT_SOMEWHAT_DISSATISFIED = np.array([2, 2, 3])
+_SAT_VERY_DISSATISFIED = np.array([1, 0, 1])
+
+# Percentages, one row per response level from very dissatisfied to very satisfied
+_SAT_PCT = np.stack([_SAT_VERY_DISSATISFIED, _SAT_SOMEWHAT_DISSATISFIED, _SAT_NEITHER,
+                     _SAT_SOMEWHAT_SATISFIED, _SAT_VERY_SATISFIED]) / TOTAL_PROGRAMS * 100
+
+# ASP intervention participation (%), with vs. without a formal curriculum
+_INTERVENTIONS = [
+    'Education of residents/faculty',
+    'Antibiotic Approval',
+    'Guideline Creation',
+    'Audit and Feedback',
+    'Handshake Rounds',
+    'Antibiotic Allergy Assessment',
+    'Antibiotic Timeout',
+    'None of the above'
+]
+_WITH_CURRICULUM = np.array([76.47, 70.59, 58.82, 58.82, 52.94, 35.29, 17.65, 5.88])
+_WITHOUT_CURRICULUM = np.array([50, 60, 60, 50, 50, 30, 0, 10])
+
+# Programs reporting each barrier (%)
+_BARRIERS = [
+    'Lack of educator time',
+    'Lack of materials',
+    'None of the above',
+    'Lack of AS projects',
+    'Lack of time from fellow',
+    'Lack of AS interventions'
+]
+_BARRIER_PCT = np.array([44.44, 33.33, 22.22, 14.81, 18.52, 7.41])
+
+# Survey values are shared by the cached plot data - make them read-only
+for _arr in (_MIDPOINTS, _SAT_VERY_SATISFIED, _SAT_SOMEWHAT_SATISFIED,
+             _SAT_NEITHER, _SAT_SOMEWHAT_DISSATISFIED, _SAT_VERY_DISSATISFIED,
+             _SAT_PCT, _WITH_CURRICULUM, _WITHOUT_CURRICULUM, _BARRIER_PCT):
+    _arr.flags.writeable = False
+
 # ============================================================================
 # DATA PROCESSING FUNCTIONS
 # ============================================================================
 
 def load_data():
-    """Load all data from Excel file"""
-    data = {
-        'interest': pd.read_excel(INPUT_FILE, sheet_name='Interest in AS'),
-        'satisfaction': pd.read_excel(INPUT_FILE, sheet_name='Satisfaction scales'),
-        'interventions': pd.read_excel(INPUT_FILE, sheet_name='ASP interventions'),
-        'barriers': pd.read_excel(INPUT_FILE, sheet_name='Barriers')
+    """Load figure data, reading the Parquet cache when it is newer than the Excel file"""
+    # Only the interest sheet feeds a figure; the others are hardcoded below
+    sheets = {
+        'interest': 'Interest in AS'
     }
+    cache_files = {key: CACHE_DIR / f'{key}.parquet' for key in sheets}
+    source_mtime = Path(INPUT_FILE).stat().st_mtime
+
+    # Use cached sheets if every one exists and is at least as new as the workbook
+    if all(f.exists() and f.stat().st_mtime >= source_mtime
+           for f in cache_files.values()):
+        return {key: pd.read_parquet(f) for key, f in cache_files.items()}
+
+    # Otherwise parse the workbook once and refresh the cache
+    with pd.ExcelFile(INPUT_FILE, engine='openpyxl') as xls:
+        data = {key: xls.parse(sheet_name=sheet) for key, sheet in sheets.items()}
+
+    # Arrow needs string column labels and one type per column, so convert the
+    # labels and any non-missing values in mixed-type (object) columns to str.
+    # Applied to the returned data too, so fresh and cached loads match.
+    for df in data.values():
+        df.columns = df.columns.astype(str)
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v))
+
+    # The cache is optional - on any failure drop partial files and carry on
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        for key, df in data.items():
+            df.to_parquet(cache_files[key], compression='zstd')
+    except (ImportError, OSError, ValueError, TypeError) as e:
+        for f in cache_files.values():
+            f.unlink(missing_ok=True)
+        print(f"  (Parquet cache not written: {e})")
+
     return data
 
+def _range_counts(labels, counts):
+    """Sum the counts for each response range, in _RANGE_LABELS order"""
+    counts = pd.to_numeric(counts, errors='coerce')
+    return counts.groupby(labels).sum().reindex(_RANGE_LABELS, fill_value=0).to_numpy()
+
 def calculate_interest_career_stats(df):
     """Calculate weighted averages for interest and career placement"""
-    # Using midpoint of ranges: 0-25%=12.5%, 26-50%=37.5%, 51-75%=62.5%, 76-100%=87.5%
-    midpoints = [12.5, 37.5, 62.5, 87.5]
+    # 'Interest in AS' sheet: range labels in columns A and D, counts in B and E
+    interest_counts = _range_counts(df.iloc[:, 0], df.iloc[:, 1])
+    career_counts = _range_counts(df.iloc[:, 3], df.iloc[:, 4])
     
-    # Interest counts (from Excel): [11, 10, 5, 1]
-    interest_counts = [11, 10, 5, 1]
-    career_counts = [20, 4, 3, 0]
-    
-    avg_interest = sum([m * c for m, c in zip(midpoints, interest_counts)]) / TOTAL_PROGRAMS
-    avg_career = sum([m * c for m, c in zip(midpoints, career_counts)]) / TOTAL_PROGRAMS
+    avg_interest = _MIDPOINTS @ interest_counts / TOTAL_PROGRAMS
+    avg_career = _MIDPOINTS @ career_counts / TOTAL_PROGRAMS
     
     return avg_interest, avg_career
 
+@lru_cache(maxsize=1)
+def _prepare_plot_data():
+    """Collect everything the figures need into a small dict of plain arrays
+
+    The interest/career averages are computed from the 'Interest in AS' sheet
+    (via load_data); everything else comes from the SURVEY DATA constants
+    above. Only this dict is passed to the rendering workers, never the
+    DataFrames. The result is cached and shared, so every array in it is
+    read-only.
+    """
+    data = load_data()
+    avg_interest, avg_career = calculate_interest_career_stats(data['interest'])
+
+    interventions = np.array(_INTERVENTIONS, dtype=object)
+    barriers = np.array(_BARRIERS, dtype=object)
+    interventions.flags.writeable = False
+    barriers.flags.writeable = False
+
+    return {
+        'avg_interest': avg_interest,
+        'avg_career': avg_career,
+        'satisfaction_categories': tuple(_SAT_CATEGORIES),
+        'satisfaction_pct': _SAT_PCT,
+        'interventions': interventions,
+        'with_curriculum': _WITH_CURRICULUM,
+        'without_curriculum': _WITHOUT_CURRICULUM,
+        'barriers': barriers,
+        'barrier_pct': _BARRIER_PCT
+    }
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def save_figure(fig, filename, pdf=None):
+    """Save to its own file in OUTPUT_DIR, or as a page of an open PdfPages"""
+    if pdf is not None:
+        pdf.savefig(fig, dpi=DPI, bbox_inches='tight')
+    else:
+        fig.savefig(f'{OUTPUT_DIR}{filename}', dpi=DPI, bbox_inches='tight')
+
 # ============================================================================
 # FIGURE 1: LEADERSHIP PREPAREDNESS GAP
 # ============================================================================
 
-def create_figure1(data):
+def create_figure1(fig, plot_data, pdf=None):
     """Create composite figure with career funnel and satisfaction chart"""
     
-    fig = plt.figure(figsize=(12, 8))
+    fig.clear()
+    fig.set_size_inches(12, 8)
     
     # ---- PART A: CAREER FUNNEL ----
-    ax1 = plt.subplot(2, 1, 1)
+    ax1 = fig.add_subplot(2, 1, 1)
     ax1.axis('off')
     ax1.set_xlim(0, 10)
     ax1.set_ylim(0, 10)
     
     # Calculate statistics
-    avg_interest, avg_career = calculate_interest_career_stats(data['interest'])
+    avg_interest = plot_data['avg_interest']
+    avg_career = plot_data['avg_career']
     gap_size = avg_interest - avg_career
     
     # Title
@@ -103,7 +259,8 @@ def create_figure1(data):
                                    boxstyle="round,pad=0.1",
                                    edgecolor=COLOR_POSITIVE, 
                                    facecolor=COLOR_POSITIVE_LIGHTER,
-                                   linewidth=3)
+                                   linewidth=3,
+                                   rasterized=RASTERIZE_DECORATIONS)
     ax1.add_patch(interest_box)
     ax1.text(5, 7.2, f'{avg_interest:.0f}%', fontsize=48, ha='center', 
              fontweight='bold', color=COLOR_POSITIVE)
@@ -121,7 +278,8 @@ def create_figure1(data):
                                 boxstyle="round,pad=0.1",
                                 edgecolor=COLOR_NEGATIVE, 
                                 facecolor=COLOR_NEGATIVE_LIGHT,
-                                linewidth=3)
+                                linewidth=3,
+                                rasterized=RASTERIZE_DECORATIONS)
     ax1.add_patch(career_box)
     ax1.text(5, 2.7, f'{avg_career:.0f}%', fontsize=48, ha='center', 
              fontweight='bold', color=COLOR_NEGATIVE)
@@ -135,36 +293,18 @@ def create_figure1(data):
                        edgecolor=COLOR_NEGATIVE, linewidth=2))
     
     # ---- PART B: SATISFACTION DIVERGING BAR CHART ----
-    ax2 = plt.subplot(2, 1, 2)
+    ax2 = fig.add_subplot(2, 1, 2)
     
     # Data from Excel
-    categories = [
-        'General education/\nbackground knowledge',
-        'Ability to use AS in\nclinical practice',
-        'Ability to assume a\nleadership role in AS'
-    ]
-    
-    very_satisfied = np.array([9, 10, 3])
-    somewhat_satisfied = np.array([14, 15, 12])
-    neither = np.array([1, 0, 8])
-    somewhat_dissatisfied = np.array([2, 2, 3])
-    very_dissatisfied = np.array([1, 0, 1])
-    
-    # Convert to percentages
-    very_satisfied_pct = very_satisfied / TOTAL_PROGRAMS * 100
-    somewhat_satisfied_pct = somewhat_satisfied / TOTAL_PROGRAMS * 100
-    neither_pct = neither / TOTAL_PROGRAMS * 100
-    somewhat_dissatisfied_pct = somewhat_dissatisfied / TOTAL_PROGRAMS * 100
-    very_dissatisfied_pct = very_dissatisfied / TOTAL_PROGRAMS * 100
+    categories = plot_data['satisfaction_categories']
+    satisfaction_pct = plot_data['satisfaction_pct']
+    (very_dissatisfied_pct, somewhat_dissatisfied_pct, neither_pct,
+     somewhat_satisfied_pct, very_satisfied_pct) = satisfaction_pct
     
     # Calculate positions for diverging layout
     y_pos = np.arange(len(categories))
     bar_height = 0.6
 
-    # Negative side (dissatisfied)
-    neg_very = -very_dissatisfied_pct
-    neg_somewhat = -somewhat_dissatisfied_pct
-
     # Positive side (satisfied)
     pos_somewhat = somewhat_satisfied_pct
     pos_very = very_satisfied_pct
@@ -174,29 +314,27 @@ def create_figure1(data):
     neutral_half = neither_pct / 2
     dissatisfied_total = somewhat_dissatisfied_pct + very_dissatisfied_pct
 
-    # Plot bars - negative side (very dissatisfied furthest left)
-    # Start from -(neutral_half + dissatisfied_total) and go RIGHT
+    # Segment widths and left edges, one column per response level
+    # (very dissatisfied furthest left, neutral centered at zero)
     very_dissatisfied_start = -(neutral_half + dissatisfied_total)
-    ax2.barh(y_pos, very_dissatisfied_pct, bar_height, left=very_dissatisfied_start,
-             label='Very Dissatisfied', color=COLOR_NEGATIVE,
-             edgecolor='black', linewidth=0.5)
-
-    somewhat_dissatisfied_start = very_dissatisfied_start + very_dissatisfied_pct
-    ax2.barh(y_pos, somewhat_dissatisfied_pct, bar_height, left=somewhat_dissatisfied_start,
-             label='Somewhat Dissatisfied', color=COLOR_NEGATIVE_LIGHT,
-             edgecolor='black', linewidth=0.5)
-
-    # Plot neutral bar centered at zero
-    ax2.barh(y_pos, neither_pct, bar_height, left=-neutral_half,
-             label='Neither', color=COLOR_NEUTRAL, edgecolor='black', linewidth=0.5)
-
-    # Plot bars - positive side starting at neutral_half
-    ax2.barh(y_pos, pos_somewhat, bar_height, left=neutral_half,
-             label='Somewhat Satisfied', color=COLOR_POSITIVE_LIGHT,
-             edgecolor='black', linewidth=0.5)
-    ax2.barh(y_pos, pos_very, bar_height, left=neutral_half + pos_somewhat,
-             label='Very Satisfied', color=COLOR_POSITIVE,
-             edgecolor='black', linewidth=0.5)
+    widths = satisfaction_pct.T
+    lefts = np.column_stack([very_dissatisfied_start,
+                             very_dissatisfied_start + very_dissatisfied_pct,
+                             -neutral_half,
+                             neutral_half,
+                             neutral_half + pos_somewhat])
+    segments = [
+        (COLOR_NEGATIVE, 'Very Dissatisfied'),
+        (COLOR_NEGATIVE_LIGHT, 'Somewhat Dissatisfied'),
+        (COLOR_NEUTRAL, 'Neither'),
+        (COLOR_POSITIVE_LIGHT, 'Somewhat Satisfied'),
+        (COLOR_POSITIVE, 'Very Satisfied')
+    ]
+
+    # Plot bars
+    for j, (color, label) in enumerate(segments):
+        ax2.barh(y_pos, widths[:, j], bar_height, left=lefts[:, j],
+                 label=label, color=color, edgecolor='black', linewidth=0.5)
     
     # Formatting
     ax2.set_yticks(y_pos)
@@ -219,17 +357,15 @@ def create_figure1(data):
     ax2.legend(handles=legend_elements, loc='lower left',
               frameon=True, fontsize=ANNOTATION_SIZE)
     
-    # Add percentage labels
-    for i in range(len(categories)):
-        neutral_half_i = neither_pct[i] / 2
-        dissatisfied_total_i = somewhat_dissatisfied_pct[i] + very_dissatisfied_pct[i]
+    # Add percentage labels (section totals and centers computed up front)
+    satisfied_total = pos_somewhat + pos_very
+    dissatisfied_center = -(neutral_half + dissatisfied_total / 2)
+    satisfied_center = neutral_half + satisfied_total / 2
 
+    for i in range(len(categories)):
         # Negative side total
-        if dissatisfied_total_i > 5:
-            # Center of dissatisfied section
-            dissatisfied_left = -(neutral_half_i + dissatisfied_total_i)
-            dissatisfied_center = dissatisfied_left + dissatisfied_total_i / 2
-            ax2.text(dissatisfied_center, i, f'{dissatisfied_total_i:.0f}%',
+        if dissatisfied_total[i] > 5:
+            ax2.text(dissatisfied_center[i], i, f'{dissatisfied_total[i]:.0f}%',
                     ha='center', va='center', fontsize=ANNOTATION_SIZE,
                     fontweight='bold')
 
@@ -240,47 +376,36 @@ def create_figure1(data):
                     fontweight='bold')
 
         # Positive side total
-        satisfied_total_i = pos_somewhat[i] + pos_very[i]
-        if satisfied_total_i > 5:
-            satisfied_center = neutral_half_i + satisfied_total_i / 2
-            ax2.text(satisfied_center, i, f'{satisfied_total_i:.0f}%',
+        if satisfied_total[i] > 5:
+            ax2.text(satisfied_center[i], i, f'{satisfied_total[i]:.0f}%',
                     ha='center', va='center', fontsize=ANNOTATION_SIZE,
                     fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(f'{OUTPUT_DIR}Figure1_Leadership_Gap.pdf',
-                dpi=DPI, bbox_inches='tight')
+    fig.tight_layout()
+    save_figure(fig, 'Figure1_Leadership_Gap.pdf', pdf)
     print("✓ Figure 1 created: Leadership Preparedness Gap")
 
 # ============================================================================
 # FIGURE 2: DUMBBELL PLOT FOR ASP INTERVENTIONS
 # ============================================================================
 
-def create_figure2(data):
+def create_figure2(fig, plot_data, pdf=None):
     """Create dumbbell plot comparing curriculum impact"""
     
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig.clear()
+    fig.set_size_inches(10, 8)
+    ax = fig.add_subplot()
     
     # Data
-    interventions = [
-        'Education of residents/faculty',
-        'Antibiotic Approval',
-        'Guideline Creation',
-        'Audit and Feedback',
-        'Handshake Rounds',
-        'Antibiotic Allergy Assessment',
-        'Antibiotic Timeout',
-        'None of the above'
-    ]
-    
-    with_curriculum = np.array([76.47, 70.59, 58.82, 58.82, 52.94, 35.29, 17.65, 5.88])
-    without_curriculum = np.array([50, 60, 60, 50, 50, 30, 0, 10])
+    interventions = plot_data['interventions']
+    with_curriculum = plot_data['with_curriculum']
+    without_curriculum = plot_data['without_curriculum']
     
     # Sort by gap size
     gaps = np.abs(with_curriculum - without_curriculum)
     sorted_indices = np.argsort(gaps)[::-1]  # Descending order
     
-    interventions_sorted = [interventions[i] for i in sorted_indices]
+    interventions_sorted = interventions[sorted_indices]
     with_sorted = with_curriculum[sorted_indices]
     without_sorted = without_curriculum[sorted_indices]
     gaps_sorted = gaps[sorted_indices]
@@ -288,17 +413,22 @@ def create_figure2(data):
     y_pos = np.arange(len(interventions_sorted))
     
     # Plot dumbbells
-    for i in range(len(interventions_sorted)):
-        # Connecting line
-        ax.plot([without_sorted[i], with_sorted[i]], [i, i], 
-               'o-', color=COLOR_GRAY, linewidth=2, markersize=10,
-               markerfacecolor='white', markeredgewidth=2)
-        
-        # Dots
-        ax.plot(with_sorted[i], i, 'o', markersize=12, 
-               color=COLOR_POSITIVE, zorder=3)
-        ax.plot(without_sorted[i], i, 'o', markersize=12,
-               color=COLOR_NEGATIVE, zorder=3)
+    # Connecting lines - all segments in a single collection
+    segments = np.stack([np.column_stack([without_sorted, y_pos]),
+                         np.column_stack([with_sorted, y_pos])], axis=1)
+    ax.add_collection(LineCollection(segments, colors=COLOR_GRAY,
+                                     linewidths=2, zorder=2,
+                                     rasterized=RASTERIZE_DECORATIONS))
+    ax.scatter(np.concatenate([without_sorted, with_sorted]),
+               np.concatenate([y_pos, y_pos]), s=10**2, facecolors='white',
+               edgecolors=COLOR_GRAY, linewidths=2, zorder=2,
+               rasterized=RASTERIZE_DECORATIONS)
+
+    # Dots
+    ax.scatter(with_sorted, y_pos, s=12**2, color=COLOR_POSITIVE, zorder=3,
+               rasterized=RASTERIZE_DECORATIONS)
+    ax.scatter(without_sorted, y_pos, s=12**2, color=COLOR_NEGATIVE, zorder=3,
+               rasterized=RASTERIZE_DECORATIONS)
     
     # Formatting
     ax.set_yticks(y_pos)
@@ -323,47 +453,40 @@ def create_figure2(data):
              frameon=True, fontsize=TICK_SIZE)
     
     # Add gap annotations for all interventions
-    for i in range(len(interventions_sorted)):
-        gap = gaps_sorted[i]
-        mid_point = (with_sorted[i] + without_sorted[i]) / 2
-        ax.text(mid_point, i + 0.35, f'Δ{gap:.1f}%',
-               ha='center', fontsize=ANNOTATION_SIZE, style='italic')
-    
-    plt.tight_layout()
-    plt.savefig(f'{OUTPUT_DIR}Figure2_ASP_Interventions_Dumbbell.pdf',
-               dpi=DPI, bbox_inches='tight')
+    mid_points = (with_sorted + without_sorted) / 2
+    gap_labels = [f'Δ{gap:.1f}%' for gap in gaps_sorted]
+    for x, y, label in zip(mid_points, y_pos + 0.35, gap_labels):
+        ax.text(x, y, label, ha='center', fontsize=ANNOTATION_SIZE, style='italic')
+    
+    fig.tight_layout()
+    save_figure(fig, 'Figure2_ASP_Interventions_Dumbbell.pdf', pdf)
     print("✓ Figure 2 created: ASP Interventions Dumbbell Plot")
 
 # ============================================================================
 # FIGURE 3: BARRIERS TO EDUCATION
 # ============================================================================
 
-def create_figure3(data):
-    """Create horizontal bar chart of barriers"""
+def create_figure3(fig, plot_data, pdf=None):
+    """Create horizontal bar chart of barriers (blue and red versions)"""
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig.clear()
+    fig.set_size_inches(10, 6)
+    ax = fig.add_subplot()
     
     # Data
-    barriers = [
-        'Lack of educator time',
-        'Lack of materials',
-        'None of the above',
-        'Lack of AS projects',
-        'Lack of time from fellow',
-        'Lack of AS interventions'
-    ]
-    
-    percentages = np.array([44.44, 33.33, 22.22, 14.81, 18.52, 7.41])
+    barriers = plot_data['barriers']
+    percentages = plot_data['barrier_pct']
     
     # Sort from highest to lowest (will be displayed bottom to top, so reverse for top to bottom)
     sorted_indices = np.argsort(percentages)  # Ascending order for top-to-bottom display
-    barriers_sorted = [barriers[i] for i in sorted_indices]
+    barriers_sorted = barriers[sorted_indices]
     percentages_sorted = percentages[sorted_indices]
 
     # Plot with single color
     y_pos = np.arange(len(barriers_sorted))
     bars = ax.barh(y_pos, percentages_sorted, color=COLOR_POSITIVE,
-                   edgecolor='black', linewidth=1.2, height=0.7)
+                   edgecolor='black', linewidth=1.2, height=0.7,
+                   rasterized=RASTERIZE_DECORATIONS)
     
     # Formatting
     ax.set_yticks(y_pos)
@@ -384,61 +507,108 @@ def create_figure3(data):
                f'{pct:.1f}%', ha='left', va='center',
                fontsize=TICK_SIZE, fontweight='bold')
 
-    plt.tight_layout()
-    plt.savefig(f'{OUTPUT_DIR}Figure3_Barriers.pdf',
-               dpi=DPI, bbox_inches='tight')
+    fig.tight_layout()
+    save_figure(fig, 'Figure3_Barriers.pdf', pdf)
     print("✓ Figure 3 created: Barriers to Education")
 
-def create_figure3_red(data):
-    """Create horizontal bar chart of barriers with red bars"""
-
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    # Data
-    barriers = [
-        'Lack of educator time',
-        'Lack of materials',
-        'None of the above',
-        'Lack of AS projects',
-        'Lack of time from fellow',
-        'Lack of AS interventions'
-    ]
+    # Red version (same as Very Dissatisfied) - recolor the existing bars
+    # and save again rather than rebuilding the whole layout
+    for bar in bars:
+        bar.set_facecolor(COLOR_NEGATIVE)
 
-    percentages = np.array([44.44, 33.33, 22.22, 14.81, 18.52, 7.41])
+    save_figure(fig, 'Figure3_Barriers_Red.pdf', pdf)
+    print("✓ Figure 3 (Red version) created: Barriers to Education")
 
-    # Sort from highest to lowest (will be displayed bottom to top, so reverse for top to bottom)
-    sorted_indices = np.argsort(percentages)  # Ascending order for top-to-bottom display
-    barriers_sorted = [barriers[i] for i in sorted_indices]
-    percentages_sorted = percentages[sorted_indices]
+# ============================================================================
+# PARALLEL RENDERING
+# ============================================================================
 
-    # Plot with red color (same as Very Dissatisfied)
-    y_pos = np.arange(len(barriers_sorted))
-    bars = ax.barh(y_pos, percentages_sorted, color=COLOR_NEGATIVE,
-                   edgecolor='black', linewidth=1.2, height=0.7)
+def setup_matplotlib():
+    """Apply global matplotlib settings (runs in each worker process)"""
+    plt.ioff()
 
-    # Formatting
-    ax.set_yticks(y_pos)
-    ax.set_yticklabels(barriers_sorted, fontsize=TICK_SIZE)
-    ax.set_xlabel('Percentage of Programs Reporting Barrier (%)',
-                 fontsize=LABEL_SIZE, fontweight='bold')
-    ax.set_title('Limited Educator Time is the Primary Barrier\nto AS Education',
-                fontsize=TITLE_SIZE, fontweight='bold', pad=20)
-    ax.set_xlim(0, 55)
-    ax.grid(axis='x', alpha=0.3, linestyle='--')
-    ax.set_axisbelow(True)
-    ax.tick_params(labelsize=TICK_SIZE)
+    plt.rcParams['font.family'] = FONT_FAMILY
+    plt.rcParams['font.size'] = TICK_SIZE
+    plt.rcParams['axes.linewidth'] = 1.2
+    plt.rcParams['xtick.major.width'] = 1.2
+    plt.rcParams['ytick.major.width'] = 1.2
 
-    # Add value labels
-    for i, (bar, pct) in enumerate(zip(bars, percentages_sorted)):
-        width = bar.get_width()
-        ax.text(width + 1.5, bar.get_y() + bar.get_height()/2,
-               f'{pct:.1f}%', ha='left', va='center',
-               fontsize=TICK_SIZE, fontweight='bold')
+    # Make PDFs editable in Adobe Illustrator
+    plt.rcParams['pdf.fonttype'] = 42   # Embed fonts as TrueType (editable)
+    plt.rcParams['ps.fonttype'] = 42
+    plt.rcParams['svg.fonttype'] = 'none'  # For SVGs, keep text as text
 
-    plt.tight_layout()
-    plt.savefig(f'{OUTPUT_DIR}Figure3_Barriers_Red.pdf',
-               dpi=DPI, bbox_inches='tight')
-    print("✓ Figure 3 (Red version) created: Barriers to Education")
+_figure = None  # Reused Figure for this process (created by _init_worker)
+
+def _init_worker():
+    """Worker initializer: apply settings and allocate the shared Figure once"""
+    global _figure
+    setup_matplotlib()
+    _figure = plt.figure()
+
+# Figure name -> (function, output files, plot_data keys it uses)
+_FIGURES = {
+    'fig1': (create_figure1, ['Figure1_Leadership_Gap.pdf'],
+             ['avg_interest', 'avg_career', 'satisfaction_categories', 'satisfaction_pct']),
+    'fig2': (create_figure2, ['Figure2_ASP_Interventions_Dumbbell.pdf'],
+             ['interventions', 'with_curriculum', 'without_curriculum']),
+    'fig3': (create_figure3, ['Figure3_Barriers.pdf', 'Figure3_Barriers_Red.pdf'],
+             ['barriers', 'barrier_pct'])
+}
+
+def _figure_hash(name, plot_data):
+    """Hash of everything that affects a figure's output
+
+    Covers only this figure's data (so editing one figure's data re-renders
+    just that figure), its plotting function, the shared rcParams and save
+    settings, the style settings below and the matplotlib version.
+    """
+    func, _, keys = _FIGURES[name]
+    # Output-affecting CONFIGURATION settings - add new style constants here
+    style = (COLOR_POSITIVE, COLOR_NEGATIVE, COLOR_NEUTRAL, COLOR_POSITIVE_LIGHT,
+             COLOR_POSITIVE_LIGHTER, COLOR_NEGATIVE_LIGHT, COLOR_GRAY, FONT_FAMILY,
+             TITLE_SIZE, SUBTITLE_SIZE, LABEL_SIZE, TICK_SIZE, ANNOTATION_SIZE,
+             DPI, RASTERIZE_DECORATIONS)
+    key = hashlib.sha256()
+    key.update(repr([plot_data[k] for k in keys]).encode())
+    for code in (func, setup_matplotlib, save_figure):
+        key.update(inspect.getsource(code).encode())
+    key.update(repr(style).encode())
+    key.update(matplotlib.__version__.encode())
+    return key.hexdigest()
+
+def _is_up_to_date(filenames, key):
+    """True if every output exists and its .sha256 sidecar matches key"""
+    for filename in filenames:
+        sidecar = Path(f'{OUTPUT_DIR}{filename}.sha256')
+        if not (Path(f'{OUTPUT_DIR}{filename}').exists() and sidecar.exists()
+                and sidecar.read_text().strip() == key):
+            return False
+    return True
+
+def _render(name, plot_data, pdf=None):
+    """Create a single figure by name (top-level so worker processes can call it)
+
+    Returns True if the figure was rendered, False if it was skipped as unchanged.
+    """
+    if name not in _FIGURES:
+        raise ValueError(f"Unknown figure: {name}")
+    func, filenames, _ = _FIGURES[name]
+
+    # Multi-page output always needs every page, so only skip in per-file mode
+    if pdf is not None:
+        func(_figure, plot_data, pdf)
+        return True
+
+    key = _figure_hash(name, plot_data)
+    if SKIP_UNCHANGED and _is_up_to_date(filenames, key):
+        print(f"- {', '.join(filenames)} unchanged, skipped")
+        return False
+
+    func(_figure, plot_data)
+    for filename in filenames:
+        Path(f'{OUTPUT_DIR}{filename}.sha256').write_text(key + '\n')
+    return True
 
 # ============================================================================
 # MAIN EXECUTION
@@ -453,35 +623,44 @@ if __name__ == '__main__':
     print(f"DPI: {DPI}")
     print(f"Sample size: {TOTAL_PROGRAMS} programs\n")
     
-    # Set matplotlib parameters
-    plt.rcParams['font.family'] = FONT_FAMILY
-    plt.rcParams['font.size'] = TICK_SIZE
-    plt.rcParams['axes.linewidth'] = 1.2
-    plt.rcParams['xtick.major.width'] = 1.2
-    plt.rcParams['ytick.major.width'] = 1.2
-
-    # Make PDFs editable in Adobe Illustrator
-    plt.rcParams['pdf.fonttype'] = 42   # Embed fonts as TrueType (editable)
-    plt.rcParams['ps.fonttype'] = 42
-    plt.rcParams['svg.fonttype'] = 'none'  # For SVGs, keep text as text
-    
     # Load data
     print("Loading data...")
-    data = load_data()
+    plot_data = _prepare_plot_data()
     print("✓ Data loaded successfully\n")
     
-    # Create figures
     print("Creating figures...")
-    create_figure1(data)
-    create_figure2(data)
-    create_figure3(data)
-    create_figure3_red(data)
+    figures = ['fig1', 'fig2', 'fig3']
+    if COMBINED_PDF:
+        # One multi-page PDF - pages must be written in order from this process
+        _init_worker()
+        with PdfPages(f'{OUTPUT_DIR}{COMBINED_PDF_NAME}') as pdf:
+            for name in figures:
+                _render(name, plot_data, pdf)
+            page_count = pdf.get_pagecount()
+        rendered, skipped = [f'{COMBINED_PDF_NAME} ({page_count} pages)'], []
+    else:
+        # Each figure is independent, so render them in parallel
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS,
+                                 initializer=_init_worker) as executor:
+            results = list(executor.map(_render, figures, [plot_data] * len(figures)))
+        rendered, skipped = [], []
+        for name, was_rendered in zip(figures, results):
+            (rendered if was_rendered else skipped).extend(_FIGURES[name][1])
 
     print("\n" + "="*70)
-    print("ALL FIGURES CREATED SUCCESSFULLY!")
+    if not skipped:
+        print("ALL FIGURES CREATED SUCCESSFULLY!")
+    elif rendered:
+        print("CHANGED FIGURES CREATED SUCCESSFULLY!")
+    else:
+        print("NOTHING TO DO - ALL FIGURES UNCHANGED")
     print("="*70)
-    print("\nFiles saved to output directory:")
-    print("  - Figure1_Leadership_Gap.pdf")
-    print("  - Figure2_ASP_Interventions_Dumbbell.pdf")
-    print("  - Figure3_Barriers.pdf")
-    print("  - Figure3_Barriers_Red.pdf\n")
+    if rendered:
+        print("\nFiles saved to output directory:")
+        for filename in rendered:
+            print(f"  - {filename}")
+    if skipped:
+        print("\nUnchanged, skipped (set SKIP_UNCHANGED = False to force):")
+        for filename in skipped:
+            print(f"  - {filename}")
+    print()